@@ -8,6 +8,7 @@ anchors, registry entries, and asset versions should already be coherent.
 
 from __future__ import annotations
 
+import functools
 import gzip
 import html
 import json
@@ -33,9 +34,14 @@ DOC_VERSION_FILES = [
     DOCS / "tracing.html",
 ]
 ALPHA_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+-alpha\.\d+$")
+DOT_SLASH_PREFIX_RE = re.compile(r"^[.]/")
+ABS_DOCS_PREFIX_RE = re.compile(r"^/docs/")
+REL_DOCS_PREFIX_RE = re.compile(r"^docs/")
 EXACT_ALPHA_PIN_RE = re.compile(r'=([0-9]+\.[0-9]+\.[0-9]+-alpha\.[0-9]+)')
 ALPHA_TAG_RE = re.compile(r"^v(\d+)\.(\d+)\.(\d+)-alpha\.(\d+)$")
 
+EXTERNAL_SCHEMES = frozenset({"http", "https", "mailto", "tel"})
+
 MOVED_STUBS = {
     "architecture.html",
     "architecture/execution-modes.html",
@@ -45,9 +51,9 @@ MOVED_STUBS = {
 
 def normalize_href(path: str) -> str:
     path = path.strip()
-    path = re.sub(r"^[.]/", "", path)
-    path = re.sub(r"^/docs/", "", path)
-    path = re.sub(r"^docs/", "", path)
+    path = DOT_SLASH_PREFIX_RE.sub("", path)
+    path = ABS_DOCS_PREFIX_RE.sub("", path)
+    path = REL_DOCS_PREFIX_RE.sub("", path)
     path = path.split("?", 1)[0].split("#", 1)[0]
     path = path.lstrip("/")
     if not path:
@@ -59,6 +65,7 @@ def normalize_href(path: str) -> str:
     return path
 
 
+@functools.lru_cache(maxsize=1)
 def registry_block() -> str:
     text = DOCS_JS.read_text(encoding="utf-8")
     start = text.index("const DOCS = [")
@@ -85,6 +92,7 @@ def registry_titles() -> set[str]:
 class PageParser(HTMLParser):
     def __init__(self) -> None:
         super().__init__(convert_charrefs=True)
+        self.source = ""
         self.ids: set[str] = set()
         self.hrefs: list[tuple[str, str]] = []
         self.assets: list[str] = []
@@ -134,8 +142,7 @@ class PageParser(HTMLParser):
 
     def _in_class(self, cls: str) -> bool:
         for _, attr in self._stack:
-            classes = set((attr.get("class") or "").split())
-            if cls in classes:
+            if cls in (attr.get("class") or "").split():
                 return True
         return False
 
@@ -154,14 +161,15 @@ def parse_pages() -> dict[Path, PageParser]:
     out: dict[Path, PageParser] = {}
     for path in sorted(DOCS.rglob("*.html")):
         parser = PageParser()
-        parser.feed(path.read_text(encoding="utf-8"))
+        parser.source = path.read_text(encoding="utf-8")
+        parser.feed(parser.source)
         out[path] = parser
     return out
 
 
 def is_external_href(href: str) -> bool:
     parsed = urlparse(href)
-    return parsed.scheme in {"http", "https", "mailto", "tel"} or href.startswith("//")
+    return parsed.scheme in EXTERNAL_SCHEMES or href.startswith("//")
 
 
 def resolve_internal(source: Path, href: str) -> tuple[Path, str]:
@@ -208,7 +216,7 @@ def check_registry(errors: list[str], pages: dict[Path, PageParser]) -> list[str
     expected = {
         path.relative_to(DOCS).as_posix()
         for path, parser in pages.items()
-        if "docs-page" in (path.read_text(encoding="utf-8").split("<body", 1)[1].split(">", 1)[0])
+        if "docs-page" in (parser.source.split("<body", 1)[1].split(">", 1)[0])
     }
     expected.difference_update(MOVED_STUBS)
     missing = sorted(expected - set(canonical))
@@ -278,7 +286,8 @@ def check_links(errors: list[str], pages: dict[Path, PageParser]) -> None:
                 errors.append(f"{rel_source}: missing internal href {href!r} ({context})")
                 continue
             if fragment and target.suffix == ".html":
-                if fragment not in ids_by_path.get(target, set()):
+                ids = ids_by_path.get(target)
+                if ids is None or fragment not in ids:
                     errors.append(f"{rel_source}: missing anchor {href!r}")
 
 
@@ -289,11 +298,14 @@ def check_asset_versions(errors: list[str], pages: dict[Path, PageParser]) -> No
             parsed = urlparse(asset)
             if parsed.scheme or not parsed.query:
                 continue
-            qs = dict(part.split("=", 1) for part in parsed.query.split("&") if "=" in part)
-            if "v" not in qs:
+            version = next(
+                (part[2:] for part in parsed.query.split("&") if part.startswith("v=")),
+                None,
+            )
+            if version is None:
                 continue
             name = os.path.basename(parsed.path)
-            versions.setdefault(name, set()).add(qs["v"])
+            versions.setdefault(name, set()).add(version)
 
     js = DOCS_JS.read_text(encoding="utf-8")
     for const, asset in {
@@ -450,15 +462,17 @@ def snippet_regions(errors: list[str]) -> dict[str, dict[str, str]]:
     for path in sorted(SNIPPETS_SRC.glob("*.rs")):
         module = path.stem
         rel = path.relative_to(ROOT).as_posix()
-        current: tuple[str, str, list[str]] | None = None
+        current: tuple[str, str, list[str], re.Pattern[str]] | None = None
         for line in path.read_text(encoding="utf-8").splitlines():
             started = REGION_START.match(line)
             if current is None:
                 if started:
-                    current = (started.group(2), started.group(1), [])
+                    rid = started.group(2)
+                    end_re = re.compile(rf"^\s*// docs:end:{re.escape(rid)}\s*$")
+                    current = (rid, started.group(1), [], end_re)
                 continue
-            rid, indent, body = current
-            if re.match(rf"^\s*// docs:end:{re.escape(rid)}\s*$", line):
+            rid, indent, body, end_re = current
+            if end_re.match(line):
                 text = "\n".join(
                     l[len(indent):] if l.startswith(indent) else l for l in body
                 )
@@ -475,7 +489,7 @@ def snippet_regions(errors: list[str]) -> dict[str, dict[str, str]]:
     return regions
 
 
-def check_code_snippets(errors: list[str], fix: bool) -> None:
+def check_code_snippets(errors: list[str], fix: bool, pages: dict[Path, PageParser]) -> None:
     """Every `<pre>` on a published top-level page declares what it is:
     `data-snippet` blocks mirror a compiled region of the docs-snippets crate
     verbatim (`cargo check -p docs-snippets` keeps them building); `data-lang`
@@ -486,10 +500,10 @@ def check_code_snippets(errors: list[str], fix: bool) -> None:
     top-level pages so hand-authored architecture prose blocks are left alone."""
     regions = snippet_regions(errors)
     referenced: set[str] = set()
-    for path in sorted(DOCS.rglob("*.html")):
+    for path, parser in pages.items():
         rel = path.relative_to(ROOT).as_posix()
         enforce_declaration = path.parent == DOCS
-        text = path.read_text(encoding="utf-8")
+        text = parser.source
         changed = False
 
         def replace(m: re.Match[str], enforce_declaration: bool = enforce_declaration) -> str:
@@ -586,7 +600,7 @@ def main() -> int:
     check_bold_cross_refs(errors, pages)
     check_release_version_pins(errors)
     check_quickstart_contract(errors)
-    check_code_snippets(errors, fix)
+    check_code_snippets(errors, fix, pages)
     if errors:
         for err in errors:
             print(f"docs lint: {err}", file=sys.stderr)
@@ -16,6 +16,22 @@ import sys
 from pathlib import Path
 from typing import Any
 
+# UI scenario metrics worth surfacing in the summary, in display order.
+UI_SUMMARY_METRICS = (
+    "initial_render_ms",
+    "height_cache_rebuild_ms",
+    "steady_scroll_selection_render_ms",
+    "render_build_ms",
+    "diff_scan_ms",
+    "foreground_handler_ms",
+    "input_control_latency_ms",
+    "render_frame_ms",
+    "snapshot_ms",
+    "file_index_suggestion_query_ms",
+    "file_index_refresh_visible_ms",
+    "total_ms",
+)
+
 
 def fmt_bytes(n: float | int) -> str:
     n = float(n)
@@ -542,25 +558,10 @@ def summarize_ui(report: dict[str, Any]) -> str:
         lines.append("comparison inputs: " + ", ".join(str(p) for p in params["compare_inputs"]))
     lines.append("")
 
-    interesting = [
-        "initial_render_ms",
-        "height_cache_rebuild_ms",
-        "steady_scroll_selection_render_ms",
-        "render_build_ms",
-        "diff_scan_ms",
-        "foreground_handler_ms",
-        "input_control_latency_ms",
-        "render_frame_ms",
-        "snapshot_ms",
-        "file_index_suggestion_query_ms",
-        "file_index_refresh_visible_ms",
-        "total_ms",
-    ]
-
     for scenario in report.get("scenarios", []):
         lines.append(f"## scenario: {scenario.get('scenario', '?')}")
         summary = scenario.get("summary", {})
-        for metric in interesting:
+        for metric in UI_SUMMARY_METRICS:
             if metric not in summary:
                 continue
             m = summary[metric]
@@ -898,11 +899,21 @@ def summarize_dhat(payload: dict[str, Any], top: int) -> str:
     ftbl: list[str] = payload["ftbl"]
     pps: list[dict[str, Any]] = payload["pps"]
     cmd = payload.get("cmd", "?")
-    total_bytes = sum(p["tb"] for p in pps)
-    total_blocks = sum(p["tbk"] for p in pps)
-    total_max_bytes = sum(p["mb"] for p in pps)
+    total_bytes = 0
+    total_blocks = 0
+    total_max_bytes = 0
+    for p in pps:
+        total_bytes += p["tb"]
+        total_blocks += p["tbk"]
+        total_max_bytes += p["mb"]
+
+    # Frame indices repeat heavily across stacks; clean each one up only once.
+    label_cache: dict[int, str] = {}
 
     def frame_label(idx: int) -> str:
+        cached = label_cache.get(idx)
+        if cached is not None:
+            return cached
         s = ftbl[idx]
         # Strip leading hex address and any " (path:line:col)" tail.
         if s.startswith("0x"):
@@ -911,6 +922,7 @@ def summarize_dhat(payload: dict[str, Any], top: int) -> str:
                 s = s[sp + 2 :]
         if " (" in s:
             s = s.split(" (")[0]
+        label_cache[idx] = s
         return s
 
     def pretty_stack(fs: list[int], depth: int = 6) -> list[str]:
@@ -939,6 +951,16 @@ def summarize_dhat(payload: dict[str, Any], top: int) -> str:
             out.append(f"    {label}")
         return out
 
+    # Hot program points show up in more than one top-N section; render each
+    # block once and reuse it.
+    rendered: dict[int, list[str]] = {}
+
+    def block_lines(p: dict[str, Any]) -> list[str]:
+        key = id(p)
+        if key not in rendered:
+            rendered[key] = fmt_block(p)
+        return rendered[key]
+
     lines = ["# dhat heap summary", ""]
     lines.append(f"command: {cmd}")
     lines.append(
@@ -949,17 +971,17 @@ def summarize_dhat(payload: dict[str, Any], top: int) -> str:
 
     lines.append(f"## top {top} call stacks by total bytes allocated")
     for p in sorted(pps, key=lambda p: -p["tb"])[:top]:
-        lines.extend(fmt_block(p))
+        lines.extend(block_lines(p))
         lines.append("")
 
     lines.append(f"## top {top} call stacks by max live bytes")
     for p in sorted(pps, key=lambda p: -p["mb"])[:top]:
-        lines.extend(fmt_block(p))
+        lines.extend(block_lines(p))
         lines.append("")
 
     lines.append(f"## top {top} call stacks by block count")
     for p in sorted(pps, key=lambda p: -p["tbk"])[:top]:
-        lines.extend(fmt_block(p))
+        lines.extend(block_lines(p))
         lines.append("")
 
     return "\n".join(lines)
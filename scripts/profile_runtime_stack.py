@@ -563,9 +563,10 @@ def main() -> int:
         scenario: budget_sample_passed(samples, scenario, budget)
         for scenario, budget in stack_budgets.items()
     }
-    out.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+    rendered = json.dumps(payload, indent=2, sort_keys=True)
+    out.write_text(rendered + "\n")
     print(f"Runtime stack matrix: {out}", file=sys.stderr)
-    print(json.dumps(payload, indent=2, sort_keys=True))
+    print(rendered)
     if args.enforce_budgets and not all(payload["budget_results"].values()):
         return 1
     if args.strict_failures:
@@ -60,6 +60,9 @@ ALREADY_PUBLISHED_ERRORS = (
     "already exists",
     "previously uploaded",
 )
+# crates.io 429 bodies name the moment the limit lifts, e.g.
+# "... try again after Mon, 01 Jan 2024 00:00:00 GMT".
+RETRY_AFTER_RE = re.compile(r"try again after ([^\n.]+GMT)", re.IGNORECASE)
 
 
 def main() -> int:
@@ -95,11 +98,19 @@ def main() -> int:
         print_plan(packages, args.version)
         return 0
 
+    # The resume scan is one read-only lookup per crate; run them concurrently
+    # under the same cap as in-layer publishing, reporting in package order.
     completed: set[str] = set()
-    for package_id, package in packages.items():
-        if crate_version_visible(package["name"], package["version"]):
-            print(f"already published: {package['name']} {package['version']}")
-            completed.add(package_id)
+    max_workers = max(1, min(args.layer_concurrency, len(packages) or 1))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        visible = executor.map(
+            lambda package: crate_version_visible(package["name"], package["version"]),
+            packages.values(),
+        )
+        for (package_id, package), is_visible in zip(packages.items(), visible):
+            if is_visible:
+                print(f"already published: {package['name']} {package['version']}")
+                completed.add(package_id)
 
     layers = compute_layers(packages, completed)
     for index, layer in enumerate(layers, start=1):
@@ -310,7 +321,7 @@ def wait_for_crate_version(name: str, version: str, args: argparse.Namespace) ->
 
 
 def retry_delay_seconds(output: str, default_delay_seconds: int) -> int:
-    match = re.search(r"try again after ([^\n.]+GMT)", output, flags=re.IGNORECASE)
+    match = RETRY_AFTER_RE.search(output)
     if not match:
         return default_delay_seconds
 
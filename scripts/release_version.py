@@ -19,6 +19,7 @@ Commands:
 
 from __future__ import annotations
 
+import functools
 import json
 import pathlib
 import re
@@ -40,6 +41,9 @@ VERSION_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
 # Pre-release versions (e.g. "0.1.0-alpha.1") and the "0.0.0-dev" working-tree
 # placeholder both match this shape.
 PRERELEASE_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)-[A-Za-z0-9.-]+$")
+DEP_NAME_RE = re.compile(r"([A-Za-z0-9_-]+)\s*=")
+DEP_PACKAGE_RE = re.compile(r'package\s*=\s*"([^"]+)"')
+DEP_EXACT_VERSION_RE = re.compile(r'version = "=[^"]+"')
 
 
 def main() -> int:
@@ -148,7 +152,10 @@ def compute_next_stable_version(channel: str) -> str:
     return format_version((highest[0], highest[1], highest[2] + 1))
 
 
-def read_release_tags() -> list[str]:
+# Cached: computing the next version walks the tag list several times
+# (per-channel scan plus tag_exists), and tags don't change mid-run.
+@functools.lru_cache(maxsize=1)
+def read_release_tags() -> tuple[str, ...]:
     result = subprocess.run(
         ["git", "tag", "--list", "v*", "--sort=-version:refname"],
         cwd=ROOT,
@@ -156,11 +163,11 @@ def read_release_tags() -> list[str]:
         capture_output=True,
         text=True,
     )
-    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+    return tuple(line.strip() for line in result.stdout.splitlines() if line.strip())
 
 
 def tag_exists(tag: str) -> bool:
-    return tag in set(read_release_tags())
+    return tag in read_release_tags()
 
 
 def parse_version(value: str) -> tuple[int, int, int]:
@@ -218,8 +225,8 @@ def update_workspace_dependency_versions(version: str) -> None:
         updated_lines = []
         for line in text.splitlines():
             stripped = line.lstrip()
-            name_match = re.match(r"([A-Za-z0-9_-]+)\s*=", stripped)
-            package_match = re.search(r'package\s*=\s*"([^"]+)"', stripped)
+            name_match = DEP_NAME_RE.match(stripped)
+            package_match = DEP_PACKAGE_RE.search(stripped)
             package_name = (
                 package_match.group(1)
                 if package_match is not None
@@ -233,11 +240,7 @@ def update_workspace_dependency_versions(version: str) -> None:
                 and "path =" in line
                 and "version =" in line
             ):
-                line = re.sub(
-                    r'version = "=[^"]+"',
-                    f'version = "={version}"',
-                    line,
-                )
+                line = DEP_EXACT_VERSION_RE.sub(f'version = "={version}"', line)
             updated_lines.append(line)
         updated = "\n".join(updated_lines) + "\n"
         if updated != text:
@@ -325,7 +328,10 @@ def read_lockstep_workspace_package_names() -> set[str]:
     return lockstep_packages
 
 
-def read_workspace_package_names() -> set[str]:
+# Cached: a stamp run asks for the member names twice (dependency rewrite and
+# lockfile pass), and stamping only rewrites versions — names never change.
+@functools.lru_cache(maxsize=1)
+def read_workspace_package_names() -> frozenset[str]:
     result = subprocess.run(
         [
             "cargo",
@@ -343,11 +349,11 @@ def read_workspace_package_names() -> set[str]:
     )
     metadata = json.loads(result.stdout)
     workspace_members = set(metadata["workspace_members"])
-    return {
+    return frozenset(
         package["name"]
         for package in metadata["packages"]
         if package["id"] in workspace_members
-    }
+    )
 
 
 if __name__ == "__main__":